@@ -4,25 +4,85 @@ GitHub User Activity CLI
 A command-line tool to fetch and display recent GitHub user activity.
 """
 
+from __future__ import annotations
+
+import os
 import sys
-import json
-import urllib.request
-import urllib.error
-from typing import List, Dict
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
+from itertools import islice
+
+# Number of events shown per user; also requested as the API page size
+DISPLAY_LIMIT = 10
+
+
+@lru_cache(maxsize=None)
+def _username_re():
+    """
+    Compile the GitHub username rule on first use: alphanumerics and hyphens,
+    not starting with a hyphen, at most 39 characters.
+    """
+    import re
+    return re.compile(r'\A[A-Za-z0-9][A-Za-z0-9-]{0,38}\Z')
+
+
+@lru_cache(maxsize=None)
+def _json_loads() -> Callable[[bytes | bytearray], Sequence[Mapping]]:
+    """
+    Return the fastest available eager JSON parser, importing it on first use.
+
+    orjson parses in native code; the stdlib json module is the
+    dependency-free fallback.
+    """
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        import json
+        return json.loads
+
+
+@lru_cache(maxsize=None)
+def _simdjson_parser_class():
+    """Return simdjson.Parser, or None when pysimdjson is not installed."""
+    try:
+        import simdjson
+    except ImportError:
+        return None
+    return simdjson.Parser
+
+
+@lru_cache(maxsize=None)
+def _thread_parsers():
+    """Per-thread storage for simdjson parsers, created on first use."""
+    import threading
+    return threading.local()
 
 
 class GitHubActivityFetcher:
     """Handles fetching and processing GitHub user activity data."""
 
-    BASE_URL = "https://api.github.com/users"
+    API_HOST = "api.github.com"
+    USERS_PATH = "/users"
+    CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'github-activity')
 
-    def __init__(self):
-        self.session_headers = {
-            'User-Agent': 'GitHub-Activity-CLI/1.0',
-            'Accept': 'application/vnd.github.v3+json'
-        }
+    # Redirects that are followed (once) rather than reported as errors
+    REDIRECT_STATUSES = frozenset({301, 302, 307, 308})
+
+    # Immutable and shared by all instances; sent as-is with every request
+    SESSION_HEADERS = (
+        ('User-Agent', 'GitHub-Activity-CLI/1.0'),
+        ('Accept', 'application/vnd.github.v3+json'),
+        ('Accept-Encoding', 'gzip'),
+    )
+
+    def __init__(self, per_page: int = DISPLAY_LIMIT):
+        self.per_page = per_page
+        # Opened on first request and then reused, so repeated fetches skip
+        # the TCP/TLS handshake
+        self._conn = None
 
-    def fetch_user_activity(self, username: str) -> List[Dict]:
+    def fetch_user_activity(self, username: str) -> Sequence[Mapping]:
         """
         Fetch recent activity for a GitHub user.
 
@@ -30,122 +90,487 @@ class GitHubActivityFetcher:
             username: GitHub username to fetch activity for
 
         Returns:
-            List of activity events as dictionaries
+            Sequence of activity events. When pysimdjson is installed this is
+            a lazy proxy that only decodes the fields that are accessed (see
+            parse_events).
 
         Raises:
             ValueError: If username is invalid
             ConnectionError: If API request fails
         """
-        if not username or not username.strip():
-            raise ValueError("Username cannot be empty")
+        return self.parse_events(self.fetch_raw(username), username)
+
+    @classmethod
+    def parse_events(cls, raw: bytes | bytearray, username: str | None = None) -> Sequence[Mapping]:
+        """
+        Parse a raw events payload.
+
+        With pysimdjson the result is a lazy proxy into the calling thread's
+        parser, which is reused for every parse on that thread so its buffers
+        stay warm. Earlier results remain valid: while proxies from a previous
+        parse are alive, the payload is parsed on a fresh parser instead.
+
+        Args:
+            raw: JSON response body from the events endpoint
+            username: User the payload belongs to. If given and the payload
+                does not parse, that user's cached copy is discarded so a
+                later 304 cannot serve it again.
 
-        url = f"{self.BASE_URL}/{username}/events"
+        Returns:
+            Sequence of activity events
+
+        Raises:
+            ConnectionError: If the payload is not valid JSON
+        """
+        parser_class = _simdjson_parser_class()
 
         try:
-            request = urllib.request.Request(url, headers=self.session_headers)
+            if parser_class is None:
+                return _json_loads()(raw)
+
+            # simdjson parsers are not thread-safe, so each thread keeps its own
+            parsers = _thread_parsers()
+            parser = getattr(parsers, 'parser', None)
+            if parser is None:
+                parser = parsers.parser = parser_class()
+
+            try:
+                return parser.parse(raw, recursive=False)
+            except RuntimeError:
+                # Raised for malformed documents, and also when the parser is
+                # still referenced by live proxies from an earlier parse
+                return parser_class().parse(raw, recursive=False)
+
+        except (ValueError, RuntimeError):
+            if username is not None:
+                cls.discard_cache(username)
+            raise ConnectionError("Invalid response from GitHub API")
+
+    def fetch_raw(self, username: str) -> bytes | bytearray:
+        """
+        Fetch the raw events payload, revalidating the on-disk copy via ETag.
 
-            with urllib.request.urlopen(request, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode('utf-8'))
-                    return data
+        A 304 Not Modified response does not count against the rate limit
+        and lets the cached body be reused without downloading it again.
+        A single redirect on the API host is followed, and HTTPS_PROXY is
+        honoured when the connection is first opened.
+
+        Args:
+            username: GitHub username to fetch activity for
+
+        Returns:
+            Decompressed JSON response body
+
+        Raises:
+            ValueError: If username is invalid
+            ConnectionError: If API request fails
+        """
+        if not username:
+            raise ValueError("Username cannot be empty")
+        if not _username_re().match(username):
+            # Rejected locally rather than costing a round-trip to a 404
+            raise ValueError(f"Invalid GitHub username: '{username}'")
+
+        # Imported here so usage errors never load the network stack
+        import gzip
+        import http.client
+        import zlib
+
+        if self._conn is None:
+            self._conn = self._open_connection(http.client.HTTPSConnection)
+
+        path = self._events_path(username, self.per_page)
+        cache_path = self._cache_path(username)
+        headers = self.SESSION_HEADERS
+
+        if os.path.exists(cache_path + '.json'):
+            etag = self._read_cache(cache_path + '.etag')
+            if etag:
+                try:
+                    etag = etag.decode('ascii')
+                except UnicodeDecodeError:
+                    etag = None
+                if etag and etag.isprintable():
+                    headers += (('If-None-Match', etag),)
                 else:
-                    raise ConnectionError(f"API returned status code: {response.status}")
+                    # Corrupt ETag: drop the entry and fetch unconditionally
+                    self.discard_cache(username)
+
+        for redirected in (False, True):
+            try:
+                response = self._request(path, headers)
+                raw = self._read_body(response)
+            except (OSError, EOFError, http.client.HTTPException) as e:
+                # Drop the connection so the next call starts from a clean state
+                self.close()
+                raise ConnectionError(f"Network error: {e}")
+
+            location = response.getheader('Location')
+            if redirected or response.status not in self.REDIRECT_STATUSES or not location:
+                break
+            # Follow a single redirect (e.g. for a renamed user) as urllib did
+            path = self._redirect_path(location)
+
+        if response.getheader('Content-Encoding') == 'gzip':
+            # The body was read in full, so the connection stays usable
+            try:
+                raw = gzip.decompress(raw)
+            except (OSError, EOFError, zlib.error):
+                raise ConnectionError("Invalid response from GitHub API")
+
+        if response.status == 200:
+            self._write_cache(cache_path, raw, response.getheader('ETag'))
+            return raw
+        elif response.status == 304:
+            cached = self._read_cache(cache_path + '.json')
+            if cached is None:
+                raise ConnectionError("Cached activity is no longer available")
+            return cached
+        elif response.status == 404:
+            raise ValueError(f"User '{username}' not found")
+        elif response.status == 403:
+            raise ConnectionError("API rate limit exceeded. Please try again later.")
+        else:
+            raise ConnectionError(f"HTTP error {response.status}: {response.reason}")
 
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                raise ValueError(f"User '{username}' not found")
-            elif e.code == 403:
-                raise ConnectionError("API rate limit exceeded. Please try again later.")
-            else:
-                raise ConnectionError(f"HTTP error {e.code}: {e.reason}")
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _events_path(cls, username: str, per_page: int) -> str:
+        """Build the request path for a user's events, memoised per user."""
+        return ''.join((cls.USERS_PATH, '/', username, '/events?per_page=', str(per_page)))
 
-        except urllib.error.URLError as e:
-            raise ConnectionError(f"Network error: {e.reason}")
+    def _open_connection(self, connection_class):
+        """
+        Create the HTTPS connection, tunnelling through the proxy named by
+        HTTPS_PROXY/https_proxy unless NO_PROXY exempts the API host.
 
-        except json.JSONDecodeError:
-            raise ConnectionError("Invalid response from GitHub API")
+        Args:
+            connection_class: http.client.HTTPSConnection
+        """
+        import urllib.parse
+        import urllib.request
+
+        proxy = urllib.request.getproxies().get('https')
+        if not proxy or urllib.request.proxy_bypass(self.API_HOST):
+            return connection_class(self.API_HOST, timeout=10)
+
+        proxy_url = urllib.parse.urlsplit(proxy if '://' in proxy else f"http://{proxy}")
+        tunnel_headers = {}
+        if proxy_url.username:
+            import base64
+
+            credentials = f"{urllib.parse.unquote(proxy_url.username)}:{urllib.parse.unquote(proxy_url.password or '')}"
+            tunnel_headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode()).decode('ascii')
+
+        # A proxy URL without a port gets its scheme's default port
+        default_port = 443 if proxy_url.scheme == 'https' else 80
+        conn = connection_class(proxy_url.hostname, proxy_url.port or default_port, timeout=10)
+        conn.set_tunnel(self.API_HOST, headers=tunnel_headers)
+        return conn
+
+    def _redirect_path(self, location: str) -> str:
+        """Turn a redirect Location on the API host into a request path."""
+        origin = f"https://{self.API_HOST}"
+        if location.startswith(origin + '/'):
+            location = location[len(origin):]
+        if not location.startswith('/'):
+            # The persistent connection can only reach the API host
+            raise ConnectionError(f"Unexpected redirect to {location}")
+        return location
+
+    def _request(self, path: str, headers: tuple[tuple[str, str], ...]):
+        """
+        Send a GET over the persistent connection.
+
+        GitHub may close an idle keep-alive connection between calls, so a
+        request that fails because the peer hung up is retried once on a
+        fresh connection.
+
+        Returns:
+            The http.client response, with its body still unread
+        """
+        for retried in (False, True):
+            try:
+                # Accept-Encoding is part of SESSION_HEADERS
+                self._conn.putrequest("GET", path, skip_accept_encoding=True)
+                for name, value in headers:
+                    self._conn.putheader(name, value)
+                self._conn.endheaders()
+                return self._conn.getresponse()
+            except (ConnectionResetError, BrokenPipeError):
+                # RemoteDisconnected is a ConnectionResetError subclass
+                self._conn.close()
+                if retried:
+                    raise
+
+    @staticmethod
+    def _read_body(response) -> bytes | bytearray:
+        """
+        Read a response body, straight into a preallocated buffer when the
+        length is known so the payload is not copied on its way to the parser.
+
+        The size comes from response.length rather than the Content-Length
+        header: http.client sets it to 0 for bodiless responses such as 304,
+        which may still carry the header.
+        """
+        length = response.length
+        if not length:
+            # Unknown length, or a bodiless response that read() just closes
+            return response.read()
+
+        body = bytearray(length)
+        received = 0
+        with memoryview(body) as view:
+            while received < length:
+                count = response.readinto(view[received:])
+                if not count:
+                    # EOFError rather than ConnectionError, which is an
+                    # OSError and would be wrapped a second time by fetch_raw
+                    raise EOFError(f"Connection closed after {received} of {length} bytes")
+                received += count
+
+        return body
+
+    def close(self):
+        """Close the underlying HTTPS connection, if one was opened."""
+        if self._conn is not None:
+            self._conn.close()
+
+    @classmethod
+    def _cache_path(cls, username: str) -> str:
+        """Return the cache file path (without extension) for a username."""
+        return os.path.join(cls.CACHE_DIR, username.lower())
+
+    @classmethod
+    def discard_cache(cls, username: str):
+        """Remove the cached events and ETag for a username, if any."""
+        cache_path = cls._cache_path(username)
+
+        # ETag first, so a crash in between never leaves it without its body
+        for suffix in ('.etag', '.json'):
+            try:
+                os.remove(cache_path + suffix)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _read_cache(path: str) -> bytes | None:
+        """Read a cache file, returning None if it cannot be read."""
+        try:
+            with open(path, 'rb') as cache_file:
+                return cache_file.read()
+        except OSError:
+            return None
+
+    def _write_cache(self, cache_path: str, raw: bytes | bytearray, etag: str | None):
+        """
+        Store the response body and its ETag. Failures are ignored.
+
+        Each file is written to a temporary file and swapped in with
+        os.replace, body first, so an interrupted or concurrent run can never
+        pair an ETag with a truncated body.
+        """
+        if not etag:
+            return
+
+        import tempfile
+
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            for suffix, data in (('.json', raw), ('.etag', etag.encode('ascii'))):
+                fd, temp_path = tempfile.mkstemp(dir=self.CACHE_DIR, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'wb') as cache_file:
+                        cache_file.write(data)
+                    os.replace(temp_path, cache_path + suffix)
+                except BaseException:
+                    os.remove(temp_path)
+                    raise
+        except (OSError, UnicodeEncodeError):
+            # Caching is best-effort; the response itself is still valid
+            pass
 
 
 class ActivityFormatter:
     """Formats GitHub activity data for terminal display."""
 
-    EVENT_FORMATTERS = {
-        'PushEvent': lambda event: f"Pushed {event['payload'].get('size', 0)} commit(s) to {event['repo']['name']}",
-        'IssuesEvent': lambda event: f"{event['payload']['action'].capitalize()} an issue in {event['repo']['name']}",
-        'WatchEvent': lambda event: f"Starred {event['repo']['name']}",
-        'CreateEvent': lambda
-            event: f"Created {event['payload'].get('ref_type', 'repository')} in {event['repo']['name']}",
-        'ForkEvent': lambda event: f"Forked {event['repo']['name']}",
-        'PullRequestEvent': lambda
-            event: f"{event['payload']['action'].capitalize()} a pull request in {event['repo']['name']}",
-        'DeleteEvent': lambda event: f"Deleted {event['payload'].get('ref_type', 'branch')} in {event['repo']['name']}",
-        'ReleaseEvent': lambda event: f"{event['payload']['action'].capitalize()} a release in {event['repo']['name']}",
-        'PublicEvent': lambda event: f"Made {event['repo']['name']} public",
+    # Known events as parallel tables indexed by event ID, ordered by how
+    # often GitHub emits each type. DETAIL_KEYS names the payload field that
+    # fills the first template slot (None: the template only takes the repo)
+    # and DETAIL_DEFAULTS its fallback; events with a detail key need a
+    # payload, and 'action' must also be present.
+    EVENT_IDS = {
+        event_type: event_id
+        for event_id, event_type in enumerate((
+            'PushEvent', 'PullRequestEvent', 'IssuesEvent', 'WatchEvent', 'CreateEvent',
+            'ForkEvent', 'DeleteEvent', 'ReleaseEvent', 'PublicEvent',
+        ))
+    }
+    TEMPLATES = (
+        "Pushed %s commit(s) to %s",
+        "%s a pull request in %s",
+        "%s an issue in %s",
+        "Starred %s",
+        "Created %s in %s",
+        "Forked %s",
+        "Deleted %s in %s",
+        "%s a release in %s",
+        "Made %s public",
+    )
+    DETAIL_KEYS = ('size', 'action', 'action', None, 'ref_type', None, 'ref_type', 'action', None)
+    DETAIL_DEFAULTS = (0, None, None, None, 'repository', None, 'branch', None, None)
+
+    # Display form of the known payload actions, built once instead of
+    # calling capitalize() per event; unknown actions fall back to it
+    ACTION_LABELS = {
+        action: action.capitalize()
+        for action in (
+            'opened', 'closed', 'reopened', 'edited', 'assigned', 'unassigned',
+            'labeled', 'unlabeled', 'created', 'published', 'released', 'prereleased',
+            'deleted', 'review_requested', 'synchronize',
+        )
     }
 
     @classmethod
-    def format_activity(cls, events: List[Dict]) -> List[str]:
+    def format_activity(cls, events: Sequence[Mapping], limit: int = DISPLAY_LIMIT) -> list[str]:
         """
         Format activity events into readable strings.
 
         Args:
-            events: List of GitHub event dictionaries
+            events: Sequence of GitHub event mappings
+            limit: Maximum number of events to format
 
         Returns:
             List of formatted activity strings
         """
-        formatted_activities = []
+        # islice keeps simdjson proxies lazy, unlike slicing
+        return [
+            f"- {activity_text}"
+            for event in islice(events, limit)  # Limit to most recent events
+            if (activity_text := cls._render(event, event.get('type'))) is not None
+        ]
 
-        for event in events[:10]:  # Limit to most recent 10 events
-            event_type = event.get('type')
+    @classmethod
+    def _render(cls, event: Mapping, event_type: str | None) -> str | None:
+        """Describe a single event, or return None if it is malformed."""
+        repo = event.get('repo') or {}
 
-            if event_type in cls.EVENT_FORMATTERS:
-                try:
-                    activity_text = cls.EVENT_FORMATTERS[event_type](event)
-                    formatted_activities.append(f"- {activity_text}")
-                except (KeyError, TypeError):
-                    # Skip malformed events
-                    continue
-            else:
-                # Handle unknown event types gracefully
-                repo_name = event.get('repo', {}).get('name', 'unknown repository')
-                formatted_activities.append(f"- {event_type} in {repo_name}")
+        event_id = cls.EVENT_IDS.get(event_type)
+        if event_id is None:
+            # Handle unknown event types gracefully
+            return f"{event_type} in {repo.get('name', 'unknown repository')}"
+
+        repo = repo.get('name')
+        if repo is None or repo == '':
+            # Skip malformed events
+            return None
 
-        return formatted_activities
+        detail_key = cls.DETAIL_KEYS[event_id]
+        if detail_key is None:
+            return cls.TEMPLATES[event_id] % repo
 
+        payload = event.get('payload')
+        if payload is None or payload == '':
+            return None
+
+        detail = payload.get(detail_key, cls.DETAIL_DEFAULTS[event_id])
+        if detail_key == 'action':
+            if not detail:
+                return None
+            detail = cls.ACTION_LABELS.get(detail) or detail.capitalize()
+
+        return cls.TEMPLATES[event_id] % (detail, repo)
 
 class GitHubActivityCLI:
     """Main CLI application class."""
 
+    # Upper bound on concurrent requests when several users are given
+    MAX_WORKERS = 10
+
     def __init__(self):
         self.fetcher = GitHubActivityFetcher()
         self.formatter = ActivityFormatter()
 
     def display_usage(self):
         """Display usage instructions."""
-        print("Usage: python github_activity.py <username>")
+        print("Usage: python github_activity.py [--json] <username> [<username> ...]")
         print("Example: python github_activity.py kamranahmedse")
+        print("  --json  Print the raw GitHub API response instead of a summary")
 
-    def run(self, args: List[str]):
+    def run(self, args: list[str]):
         """
         Main entry point for the CLI application.
 
         Args:
             args: Command line arguments (excluding script name)
         """
-        if len(args) != 1:
-            print("Error: Please provide exactly one GitHub username.")
+        json_output = '--json' in args
+        usernames = [arg.strip() for arg in args if arg != '--json']
+
+        if not usernames:
+            print("Error: Please provide at least one GitHub username.")
             self.display_usage()
             return 1
 
-        username = args[0].strip()
+        report = self.dump_activity if json_output else self.report_activity
+
+        if len(usernames) == 1:
+            # Nothing to overlap, so skip the thread pool
+            return report(usernames[0], self.fetcher.fetch_raw)
+
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
 
+        # One fetcher per worker thread, so each keeps its connection alive
+        # across the users it handles; all are closed once the pool is done
+        workers = threading.local()
+        fetchers = []
+
+        exit_code = 0
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(usernames))) as executor:
+                futures = [
+                    executor.submit(self._fetch_raw_pooled, workers, fetchers, username)
+                    for username in usernames
+                ]
+
+                # Report in argument order; later users keep downloading meanwhile
+                for index, (username, future) in enumerate(zip(usernames, futures)):
+                    if index and not json_output:
+                        print()
+                    exit_code |= report(username, lambda _: future.result())
+        finally:
+            for fetcher in fetchers:
+                fetcher.close()
+
+        return exit_code
+
+    @staticmethod
+    def _fetch_raw_pooled(workers, fetchers: list[GitHubActivityFetcher], username: str) -> bytes | bytearray:
+        """Fetch with this worker thread's fetcher; HTTPSConnection is not thread-safe."""
+        fetcher = getattr(workers, 'fetcher', None)
+        if fetcher is None:
+            fetcher = workers.fetcher = GitHubActivityFetcher()
+            fetchers.append(fetcher)
+        return fetcher.fetch_raw(username)
+
+    def report_activity(self, username: str, fetch_raw: Callable[[str], bytes | bytearray]) -> int:
+        """
+        Fetch, format and print the activity of a single user.
+
+        Args:
+            username: GitHub username to report on
+            fetch_raw: Callable returning the raw events payload for username
+
+        Returns:
+            Exit code for this user (0 on success, 1 on error)
+        """
         try:
             print(f"Fetching activity for GitHub user: {username}")
             print("-" * 50)
 
             # Fetch user activity
-            events = self.fetcher.fetch_user_activity(username)
+            events = self.fetcher.parse_events(fetch_raw(username), username)
 
             if not events:
                 print(f"No recent activity found for user '{username}'")
@@ -155,9 +580,8 @@ class GitHubActivityCLI:
             formatted_activities = self.formatter.format_activity(events)
 
             if formatted_activities:
-                print("Recent Activity:")
-                for activity in formatted_activities:
-                    print(activity)
+                # One write instead of a print() per line
+                sys.stdout.write("Recent Activity:\n" + "\n".join(formatted_activities) + "\n")
             else:
                 print(f"No displayable activity found for user '{username}'")
 
@@ -175,6 +599,39 @@ class GitHubActivityCLI:
             print(f"Unexpected error: {e}")
             return 1
 
+    def dump_activity(self, username: str, fetch_raw: Callable[[str], bytes | bytearray]) -> int:
+        """
+        Write the raw events payload of a single user to stdout.
+
+        The response bytes are passed through untouched, so nothing is parsed
+        or formatted. Errors go to stderr to keep stdout machine-readable.
+
+        Args:
+            username: GitHub username to report on
+            fetch_raw: Callable returning the raw events payload for username
+
+        Returns:
+            Exit code for this user (0 on success, 1 on error)
+        """
+        try:
+            raw = fetch_raw(username)
+
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        except ConnectionError as e:
+            print(f"Connection Error: {e}", file=sys.stderr)
+            return 1
+
+        except Exception as e:
+            print(f"Unexpected error: {e}", file=sys.stderr)
+            return 1
+
+        sys.stdout.buffer.write(raw)
+        sys.stdout.buffer.write(b'\n')
+        return 0
+
 
 def main():
     """Entry point when script is run directly."""